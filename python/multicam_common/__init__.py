@@ -17,6 +17,8 @@ from .commands import (
     UploadItem,
 )
 from .status import DeviceStatus, DeviceType
+from .transfer import USE_SENDFILE, send_file
+from .batch import CommandBatch
 from .constants import (
     TCP_PORT,
     SERVICE_TYPE,
@@ -26,6 +28,9 @@ from .constants import (
     SYNC_DELAY,
     COMMAND_TIMEOUT,
     DOWNLOAD_CHUNK_SIZE,
+    UPLOAD_CHUNK_SIZE,
+    SOCKET_OPTIONS,
+    apply_socket_options,
 )
 
 __version__ = "2.0.0"
@@ -45,6 +50,11 @@ __all__ = [
     # Status
     "DeviceStatus",
     "DeviceType",
+    # Batching
+    "CommandBatch",
+    # Transfer
+    "USE_SENDFILE",
+    "send_file",
     # Constants
     "TCP_PORT",
     "SERVICE_TYPE",
@@ -54,4 +64,7 @@ __all__ = [
     "SYNC_DELAY",
     "COMMAND_TIMEOUT",
     "DOWNLOAD_CHUNK_SIZE",
+    "UPLOAD_CHUNK_SIZE",
+    "SOCKET_OPTIONS",
+    "apply_socket_options",
 ]
@@ -0,0 +1,13 @@
+"""
+Version compatibility shims for MultiCam API.
+"""
+
+import sys
+from enum import Enum
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    class StrEnum(str, Enum):
+        """String enum fallback for Python < 3.11 (no C-accelerated StrEnum)."""
+        pass
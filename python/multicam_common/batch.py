@@ -0,0 +1,66 @@
+"""
+Command broadcast batching for MultiCam API.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from .commands import CommandMessage
+
+
+class CommandBatch:
+    """
+    Batches commands to many devices into a single submit step.
+
+    A controller broadcasting to N cameras otherwise pays N separate
+    serialize-then-send rounds, with each send blocked behind the previous
+    peer's socket. Commands are serialized once when added, and submit()
+    fans the writes out across a thread pool so one slow peer does not
+    stall the whole broadcast.
+    """
+
+    def __init__(self, framed: bool = True):
+        """
+        Args:
+            framed: Serialize with the 4-byte length prefix (the preferred
+                wire format); pass False for bare JSON payloads
+        """
+        self._framed = framed
+        self._pending: List[Tuple[object, bytes]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, sock, message: CommandMessage) -> None:
+        """
+        Queue a command for a socket, serializing it immediately.
+
+        Args:
+            sock: Connected TCP socket to the target device
+            message: Command to send
+        """
+        payload = message.to_framed_bytes() if self._framed else message.to_bytes()
+        self._pending.append((sock, payload))
+
+    def submit(self, max_workers: Optional[int] = None) -> int:
+        """
+        Send all queued commands and clear the batch.
+
+        Args:
+            max_workers: Thread pool size (defaults to one worker per socket)
+
+        Returns:
+            Number of commands sent
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        if len(pending) == 1:
+            sock, payload = pending[0]
+            sock.sendall(payload)
+            return 1
+        workers = max_workers or len(pending)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(lambda item: item[0].sendall(item[1]), pending):
+                pass
+        return len(pending)
@@ -2,14 +2,78 @@
 Command and response message types for MultiCam API.
 """
 
-from dataclasses import dataclass, field, asdict
-from enum import Enum
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, fields, asdict
+from enum import unique
+from typing import Optional, List, Dict, Any, Union, Callable
 import json
+import struct
+import sys
 import time
 
+from ._compat import StrEnum
 
-class CommandType(str, Enum):
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes (orjson fast path)."""
+        return orjson.dumps(obj)
+
+    def _dumps_dataclass(obj: Any) -> bytes:
+        """Serialize a dataclass instance to UTF-8 JSON bytes (orjson fast path).
+
+        orjson walks the instance fields in C, avoiding the recursive
+        deep copy that dataclasses.asdict() performs.
+        """
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes (stdlib fallback).
+
+        Compact separators keep the output byte-identical to orjson's.
+        """
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def _dumps_dataclass(obj: Any) -> bytes:
+        """Serialize a dataclass instance to UTF-8 JSON bytes (stdlib fallback)."""
+        return json.dumps(asdict(obj), separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
+_scalar_dumps = json.dumps
+"""Stdlib scalar encoder used for per-field escaping in composed JSON."""
+
+_time = time.time
+"""Pre-bound clock; saves the LOAD_ATTR on time per factory call."""
+
+
+_dataclass_kwargs = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""Use __slots__ layouts for message classes on 3.10+; plain dataclasses on 3.8/3.9."""
+
+
+_TS_PLACEHOLDER = b'"__MULTICAM_TS__"'
+"""Timestamp placeholder used when building serialized command templates."""
+
+_OPTIONAL_COMMAND_FIELDS = (
+    "fileName",
+    "uploadUrl",
+    "s3Bucket",
+    "s3Key",
+    "awsAccessKeyId",
+    "awsSecretAccessKey",
+    "awsSessionToken",
+    "awsRegion",
+)
+"""Optional CommandMessage fields, omitted from the wire format when None."""
+
+_TEMPLATES: Dict[tuple, tuple] = {}
+"""Serialized (prefix, suffix) byte pairs for fixed-shape commands, keyed by (command, deviceId)."""
+
+
+@unique
+class CommandType(StrEnum):
     """
     Available command types for the MultiCam API.
     """
@@ -36,12 +100,18 @@ class CommandType(str, Enum):
     """Upload video file to cloud using presigned S3 URL"""
 
 
-@dataclass
+_COMMAND_LOOKUP = CommandType._value2member_map_
+"""Direct value-to-member table; skips EnumMeta.__call__ on the decode path."""
+
+
+@dataclass(**_dataclass_kwargs)
 class CommandMessage:
     """
     Command message sent to a MultiCam device.
 
-    All commands are sent as JSON over TCP socket.
+    All commands are sent as JSON over TCP socket. Framed transports should
+    use to_framed_bytes(), which prepends the 4-byte big-endian length prefix
+    in a single allocation.
     """
 
     command: CommandType
@@ -77,51 +147,164 @@ class CommandMessage:
     awsRegion: Optional[str] = None
     """AWS region (required for UPLOAD_TO_CLOUD command with IAM credentials auth)"""
 
-    def to_json(self) -> str:
+    def _to_dict(self) -> Dict[str, Any]:
         """
-        Serialize command to JSON string.
+        Build the wire-format dictionary for this command.
+
+        None-valued optional fields are omitted, saving ~30 bytes per
+        heartbeat/status message and parse time on the peer; from_json uses
+        .get() for these fields, so decoding is unaffected.
 
         Returns:
-            JSON string representation
+            Dictionary ready for JSON encoding
         """
         data = {
             "command": self.command.value if isinstance(self.command, CommandType) else self.command,
             "timestamp": self.timestamp,
             "deviceId": self.deviceId,
-            "fileName": self.fileName,
-            "uploadUrl": self.uploadUrl,
-            "s3Bucket": self.s3Bucket,
-            "s3Key": self.s3Key,
-            "awsAccessKeyId": self.awsAccessKeyId,
-            "awsSecretAccessKey": self.awsSecretAccessKey,
-            "awsSessionToken": self.awsSessionToken,
-            "awsRegion": self.awsRegion,
         }
-        return json.dumps(data)
+        for name in _OPTIONAL_COMMAND_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
+    def to_json(self) -> str:
+        """
+        Serialize command to JSON string.
+
+        The field order and types are fixed, so the JSON is composed directly
+        from per-field scalar encodes rather than building a dict and running
+        the generic encoder's type dispatch over it. None-valued optional
+        fields are omitted from the output.
+
+        Returns:
+            JSON string representation
+        """
+        cmd = self.command.value if isinstance(self.command, CommandType) else self.command
+        if self._is_fixed_shape():
+            return (
+                f'{{"command":{_scalar_dumps(cmd)},'
+                f'"timestamp":{_scalar_dumps(self.timestamp)},'
+                f'"deviceId":{_scalar_dumps(self.deviceId)}}}'
+            )
+        parts = [
+            f'"command":{_scalar_dumps(cmd)}',
+            f'"timestamp":{_scalar_dumps(self.timestamp)}',
+            f'"deviceId":{_scalar_dumps(self.deviceId)}',
+        ]
+        for name in _OPTIONAL_COMMAND_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                parts.append(f'"{name}":{_scalar_dumps(value)}')
+        return '{' + ','.join(parts) + '}'
+
+
+    def _is_fixed_shape(self) -> bool:
+        """
+        Check whether this command has no optional payload fields set.
+
+        Fixed-shape commands (HEARTBEAT, DEVICE_STATUS, STOP_RECORDING,
+        LIST_FILES, immediate START_RECORDING) differ only in timestamp for a
+        given (command, deviceId) pair, so their serialized form can be cached.
+
+        Returns:
+            True if all optional fields are None
+        """
+        return (
+            self.fileName is None
+            and self.uploadUrl is None
+            and self.s3Bucket is None
+            and self.s3Key is None
+            and self.awsAccessKeyId is None
+            and self.awsSecretAccessKey is None
+            and self.awsSessionToken is None
+            and self.awsRegion is None
+        )
 
     def to_bytes(self) -> bytes:
         """
         Serialize command to UTF-8 encoded bytes.
 
+        Fixed-shape commands reuse a cached serialized template per
+        (command, deviceId) pair and splice in only the timestamp, skipping
+        the dict build and full JSON encode on repeated sends.
+
         Returns:
             UTF-8 encoded JSON bytes
         """
-        return self.to_json().encode('utf-8')
+        if self._is_fixed_shape():
+            key = (self.command, self.deviceId)
+            parts = _TEMPLATES.get(key)
+            if parts is None:
+                data = self._to_dict()
+                data["timestamp"] = _TS_PLACEHOLDER[1:-1].decode('ascii')
+                prefix, _, suffix = _dumps(data).partition(_TS_PLACEHOLDER)
+                parts = _TEMPLATES[key] = (prefix, suffix)
+            prefix, suffix = parts
+            return prefix + _dumps(self.timestamp) + suffix
+        return _dumps(self._to_dict())
+
+    def to_framed_bytes(self) -> bytes:
+        """
+        Serialize command with a 4-byte big-endian length prefix.
+
+        Builds the frame in one buffer instead of leaving each caller to do
+        struct.pack('>I', len(b)) + b, which costs a second allocation and a
+        copy per send.
+
+        Returns:
+            Length-prefixed UTF-8 encoded JSON bytes
+        """
+        payload = self.to_bytes()
+        buf = bytearray(4 + len(payload))
+        struct.pack_into('>I', buf, 0, len(payload))
+        buf[4:] = payload
+        return bytes(buf)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'CommandMessage':
+    def packer(cls, command: CommandType, device_id: str = "controller") -> Callable[[float], bytes]:
         """
-        Deserialize command from JSON string.
+        Build a reusable serializer for a fixed (command, deviceId) pair.
+
+        The returned callable maps a timestamp straight to the encoded JSON
+        bytes, with every invariant part of the message pre-serialized; the
+        per-send cost is one scalar encode and one concatenation. High-QPS
+        callers sending the same command repeatedly should cache the packer
+        instead of going through a factory plus to_bytes each time.
 
         Args:
-            json_str: JSON string to parse
+            command: Command type to pack (must be a fixed-shape command)
+            device_id: ID of the sending device
+
+        Returns:
+            Callable taking a Unix timestamp and returning UTF-8 JSON bytes
+        """
+        key = (command, device_id)
+        parts = _TEMPLATES.get(key)
+        if parts is None:
+            cls(command=command, timestamp=0.0, deviceId=device_id).to_bytes()
+            parts = _TEMPLATES[key]
+        prefix, suffix = parts
+        return lambda timestamp, _p=prefix, _s=suffix: _p + _dumps(timestamp) + _s
+
+    @classmethod
+    def from_json(cls, json_str: Union[str, bytes]) -> 'CommandMessage':
+        """
+        Deserialize command from a JSON string or UTF-8 bytes.
+
+        Args:
+            json_str: JSON string or bytes to parse
 
         Returns:
             CommandMessage instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         return cls(
-            command=CommandType(data['command']),
+            command=_COMMAND_LOOKUP.get(data['command']) or CommandType(data['command']),
             timestamp=data['timestamp'],
             deviceId=data.get('deviceId', 'controller'),
             fileName=data.get('fileName'),
@@ -148,41 +331,43 @@ class CommandMessage:
         """
         return cls(
             command=CommandType.START_RECORDING,
-            timestamp=timestamp or time.time(),
+            timestamp=timestamp or _time(),
             deviceId=device_id,
         )
 
     @classmethod
-    def stop_recording(cls, device_id: str = "controller") -> 'CommandMessage':
+    def stop_recording(cls, device_id: str = "controller", timestamp: Optional[float] = None) -> 'CommandMessage':
         """
         Create a STOP_RECORDING command.
 
         Args:
             device_id: ID of the sending device
+            timestamp: Shared timestamp to reuse (None to read the clock)
 
         Returns:
             CommandMessage instance
         """
         return cls(
             command=CommandType.STOP_RECORDING,
-            timestamp=time.time(),
+            timestamp=_time() if timestamp is None else timestamp,
             deviceId=device_id,
         )
 
     @classmethod
-    def device_status(cls, device_id: str = "controller") -> 'CommandMessage':
+    def device_status(cls, device_id: str = "controller", timestamp: Optional[float] = None) -> 'CommandMessage':
         """
         Create a DEVICE_STATUS command.
 
         Args:
             device_id: ID of the sending device
+            timestamp: Shared timestamp to reuse (None to read the clock)
 
         Returns:
             CommandMessage instance
         """
         return cls(
             command=CommandType.DEVICE_STATUS,
-            timestamp=time.time(),
+            timestamp=_time() if timestamp is None else timestamp,
             deviceId=device_id,
         )
 
@@ -200,30 +385,31 @@ class CommandMessage:
         """
         return cls(
             command=CommandType.GET_VIDEO,
-            timestamp=time.time(),
+            timestamp=_time(),
             deviceId=device_id,
             fileName=file_name,
         )
 
     @classmethod
-    def heartbeat(cls, device_id: str = "controller") -> 'CommandMessage':
+    def heartbeat(cls, device_id: str = "controller", timestamp: Optional[float] = None) -> 'CommandMessage':
         """
         Create a HEARTBEAT command.
 
         Args:
             device_id: ID of the sending device
+            timestamp: Shared timestamp to reuse (None to read the clock)
 
         Returns:
             CommandMessage instance
         """
         return cls(
             command=CommandType.HEARTBEAT,
-            timestamp=time.time(),
+            timestamp=_time() if timestamp is None else timestamp,
             deviceId=device_id,
         )
 
     @classmethod
-    def list_files(cls, device_id: str = "controller") -> 'CommandMessage':
+    def list_files(cls, device_id: str = "controller", timestamp: Optional[float] = None) -> 'CommandMessage':
         """
         Create a LIST_FILES command.
 
@@ -231,16 +417,35 @@ class CommandMessage:
 
         Args:
             device_id: ID of the sending device
+            timestamp: Shared timestamp to reuse (None to read the clock)
 
         Returns:
             CommandMessage instance
         """
         return cls(
             command=CommandType.LIST_FILES,
-            timestamp=time.time(),
+            timestamp=_time() if timestamp is None else timestamp,
             deviceId=device_id,
         )
 
+    @classmethod
+    def batch(cls, builders: List[Callable[[float], 'CommandMessage']]) -> List['CommandMessage']:
+        """
+        Build several commands sharing a single clock read.
+
+        Controllers often emit command pairs back-to-back (e.g. start plus
+        status); snapshotting time.time() once keeps their timestamps
+        identical and avoids a clock call per factory.
+
+        Args:
+            builders: Callables mapping the shared timestamp to a command
+
+        Returns:
+            CommandMessage instances, all carrying the same timestamp
+        """
+        ts = _time()
+        return [build(ts) for build in builders]
+
     @classmethod
     def upload_to_cloud(cls, file_name: str, upload_url: str, device_id: str = "controller") -> 'CommandMessage':
         """
@@ -259,7 +464,7 @@ class CommandMessage:
         """
         return cls(
             command=CommandType.UPLOAD_TO_CLOUD,
-            timestamp=time.time(),
+            timestamp=_time(),
             deviceId=device_id,
             fileName=file_name,
             uploadUrl=upload_url,
@@ -291,7 +496,7 @@ class CommandMessage:
         """
         return cls(
             command=CommandType.UPLOAD_TO_CLOUD,
-            timestamp=time.time(),
+            timestamp=_time(),
             deviceId=device_id,
             fileName=file_name,
             s3Bucket=s3_bucket,
@@ -303,7 +508,7 @@ class CommandMessage:
         )
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class StatusResponse:
     """
     Status response from a MultiCam device.
@@ -331,17 +536,20 @@ class StatusResponse:
     """Failed upload queue"""
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'StatusResponse':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'StatusResponse':
         """
-        Deserialize response from JSON string.
+        Deserialize response from a JSON string or UTF-8 bytes.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON string or bytes to parse
 
         Returns:
             StatusResponse instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         upload_queue = [UploadItem.from_dict(item) for item in data.get('uploadQueue', [])]
         failed_upload_queue = [UploadItem.from_dict(item) for item in data.get('failedUploadQueue', [])]
 
@@ -362,19 +570,10 @@ class StatusResponse:
         Returns:
             JSON string representation
         """
-        data = {
-            'deviceId': self.deviceId,
-            'status': self.status,
-            'timestamp': self.timestamp,
-            'batteryLevel': self.batteryLevel,
-            'deviceType': self.deviceType,
-            'uploadQueue': [asdict(item) for item in self.uploadQueue],
-            'failedUploadQueue': [asdict(item) for item in self.failedUploadQueue],
-        }
-        return json.dumps(data)
+        return _dumps_dataclass(self).decode('utf-8')
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class StopRecordingResponse:
     """
     Response to STOP_RECORDING command.
@@ -396,17 +595,20 @@ class StopRecordingResponse:
     """File size in bytes"""
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'StopRecordingResponse':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'StopRecordingResponse':
         """
-        Deserialize response from JSON string.
+        Deserialize response from a JSON string or UTF-8 bytes.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON string or bytes to parse
 
         Returns:
             StopRecordingResponse instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         return cls(
             deviceId=data['deviceId'],
             status=data['status'],
@@ -422,10 +624,13 @@ class StopRecordingResponse:
         Returns:
             JSON string representation
         """
-        return json.dumps(asdict(self))
+        encoder = _FAST_ENCODERS.get(type(self))
+        if encoder is not None:
+            return encoder(self)
+        return _dumps_dataclass(self).decode('utf-8')
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class ErrorResponse:
     """
     Error response from a MultiCam device.
@@ -444,17 +649,20 @@ class ErrorResponse:
     """Human-readable error message"""
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'ErrorResponse':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'ErrorResponse':
         """
-        Deserialize response from JSON string.
+        Deserialize response from a JSON string or UTF-8 bytes.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON string or bytes to parse
 
         Returns:
             ErrorResponse instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         return cls(
             deviceId=data['deviceId'],
             status=data['status'],
@@ -469,10 +677,13 @@ class ErrorResponse:
         Returns:
             JSON string representation
         """
-        return json.dumps(asdict(self))
+        encoder = _FAST_ENCODERS.get(type(self))
+        if encoder is not None:
+            return encoder(self)
+        return _dumps_dataclass(self).decode('utf-8')
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class FileMetadata:
     """
     Metadata for a single video file.
@@ -509,7 +720,7 @@ class FileMetadata:
         )
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class FileResponse:
     """
     Header for binary file transfer.
@@ -520,6 +731,9 @@ class FileResponse:
     1. Header size (4 bytes, big-endian uint32)
     2. JSON FileResponse header
     3. Binary file data
+
+    Servers should stream step 3 with transfer.send_file(), which uses
+    zero-copy sendfile where the platform supports it.
     """
 
     deviceId: str
@@ -535,17 +749,20 @@ class FileResponse:
     """Status (typically 'ready')"""
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'FileResponse':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'FileResponse':
         """
-        Deserialize file response from JSON string.
+        Deserialize file response from a JSON string or UTF-8 bytes.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON string or bytes to parse
 
         Returns:
             FileResponse instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         return cls(
             deviceId=data['deviceId'],
             fileName=data['fileName'],
@@ -560,10 +777,13 @@ class FileResponse:
         Returns:
             JSON string representation
         """
-        return json.dumps(asdict(self))
+        encoder = _FAST_ENCODERS.get(type(self))
+        if encoder is not None:
+            return encoder(self)
+        return _dumps_dataclass(self).decode('utf-8')
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class ListFilesResponse:
     """
     Response to LIST_FILES command.
@@ -584,17 +804,20 @@ class ListFilesResponse:
     """List of available files"""
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'ListFilesResponse':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'ListFilesResponse':
         """
-        Deserialize list files response from JSON string.
+        Deserialize list files response from a JSON string or UTF-8 bytes.
 
         Args:
-            json_str: JSON string to parse
+            json_str: JSON string or bytes to parse
 
         Returns:
             ListFilesResponse instance
         """
-        data = json.loads(json_str)
+        decoder = _DECODERS.get(cls)
+        if decoder is not None:
+            return decoder.decode(json_str)
+        data = _loads(json_str)
         files = [FileMetadata.from_dict(f) for f in data.get('files', [])]
         return cls(
             deviceId=data['deviceId'],
@@ -610,16 +833,11 @@ class ListFilesResponse:
         Returns:
             JSON string representation
         """
-        data = {
-            'deviceId': self.deviceId,
-            'status': self.status,
-            'timestamp': self.timestamp,
-            'files': [asdict(f) for f in self.files],
-        }
-        return json.dumps(data)
+        return _dumps_dataclass(self).decode('utf-8')
 
 
-class UploadStatus(str, Enum):
+@unique
+class UploadStatus(StrEnum):
     """Upload item status values."""
 
     QUEUED = "queued"
@@ -635,7 +853,7 @@ class UploadStatus(str, Enum):
     """Upload failed (see error field)"""
 
 
-@dataclass
+@dataclass(**_dataclass_kwargs)
 class UploadItem:
     """
     Upload item with progress information.
@@ -688,3 +906,59 @@ class UploadItem:
             uploadUrl=data.get('uploadUrl'),
             error=data.get('error'),
         )
+
+def _make_encoder(cls) -> Callable[[Any], str]:
+    """
+    Compile a specialized JSON encoder for a flat dataclass.
+
+    Walks dataclasses.fields(cls) once and generates an f-string encoder
+    that reads the fields in declaration order, escaping each scalar with
+    _scalar_dumps. Replaces the asdict() deep copy plus generic encoder
+    type dispatch with a single format step. Only valid for classes whose
+    fields are all scalars.
+
+    Args:
+        cls: Dataclass to build an encoder for
+
+    Returns:
+        Callable mapping an instance to its JSON string
+    """
+    body = ",".join(f'"{f.name}":{{_sd(o.{f.name})}}' for f in fields(cls))
+    namespace = {"_sd": _scalar_dumps}
+    exec(f"def enc(o):\n    return f'{{{{{body}}}}}'", namespace)
+    return namespace["enc"]
+
+
+_FAST_ENCODERS = {
+    cls: _make_encoder(cls)
+    for cls in (
+        StopRecordingResponse,
+        ErrorResponse,
+        FileResponse,
+    )
+}
+"""Compiled flat-dataclass encoders, keyed by class and built once at import time."""
+
+
+# Typed JSON decoders (optional msgspec fast path).
+#
+# msgspec parses JSON directly into the target dataclass in C, skipping the
+# intermediate dict and the per-field reconstruction done in the from_json
+# fallbacks above. Decoders are compiled once at import time; when msgspec is
+# not installed, _DECODERS stays empty and from_json uses the _loads path.
+try:
+    import msgspec
+
+    _DECODERS: Dict[type, Any] = {
+        cls: msgspec.json.Decoder(cls)
+        for cls in (
+            CommandMessage,
+            StatusResponse,
+            StopRecordingResponse,
+            ErrorResponse,
+            FileResponse,
+            ListFilesResponse,
+        )
+    }
+except ImportError:
+    _DECODERS = {}
@@ -2,10 +2,14 @@
 Device status and type enumerations for MultiCam API.
 """
 
-from enum import Enum
+from enum import unique
 
+from ._compat import StrEnum
+from .constants import SUCCESS_STATUSES, ERROR_STATUSES
 
-class DeviceType(str, Enum):
+
+@unique
+class DeviceType(StrEnum):
     """
     Device type values used in API responses.
     """
@@ -23,7 +27,8 @@ class DeviceType(str, Enum):
     """OAK camera device"""
 
 
-class DeviceStatus(str, Enum):
+@unique
+class DeviceStatus(StrEnum):
     """
     Device status values used in API responses.
 
@@ -83,18 +88,9 @@ class DeviceStatus(str, Enum):
         Returns:
             True if status indicates success, False otherwise
         """
-        success_statuses = {
-            cls.READY.value,
-            cls.RECORDING.value,
-            cls.SCHEDULED_RECORDING_ACCEPTED.value,
-            cls.COMMAND_RECEIVED.value,
-            cls.RECORDING_STOPPED.value,
-            cls.STOPPING.value,
-            cls.UPLOADING.value,
-            cls.UPLOAD_QUEUED.value,
-            cls.UPLOAD_COMPLETED.value,
-        }
-        return status.lower() in success_statuses
+        # API payloads are lowercase snake_case already; only fall back to
+        # the allocating .lower() for unconventional callers.
+        return status in SUCCESS_STATUSES or status.lower() in SUCCESS_STATUSES
 
     @classmethod
     def is_error(cls, status: str) -> bool:
@@ -107,11 +103,4 @@ class DeviceStatus(str, Enum):
         Returns:
             True if status indicates an error, False otherwise
         """
-        error_statuses = {
-            cls.ERROR.value,
-            cls.TIME_NOT_SYNCHRONIZED.value,
-            cls.FILE_NOT_FOUND.value,
-            cls.UPLOAD_FAILED.value,
-            cls.CAMERA_DISCONNECTED.value,
-        }
-        return status.lower() in error_statuses
+        return status in ERROR_STATUSES or status.lower() in ERROR_STATUSES
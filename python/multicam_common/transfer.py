@@ -0,0 +1,53 @@
+"""
+File transfer helpers for MultiCam API.
+"""
+
+import os
+from typing import BinaryIO, Optional
+
+from .constants import DOWNLOAD_CHUNK_SIZE
+
+USE_SENDFILE = hasattr(os, 'sendfile')
+"""Whether zero-copy os.sendfile is available on this platform"""
+
+
+def send_file(sock, file_obj: BinaryIO, size: Optional[int] = None) -> int:
+    """
+    Send a file's contents over a connected socket.
+
+    Uses socket.sendfile() (zero-copy os.sendfile on Linux, keeping video
+    bytes out of userspace entirely) when available, otherwise a chunked
+    read/sendall loop sized by DOWNLOAD_CHUNK_SIZE.
+
+    The preferred GET_VIDEO server implementation writes the 4-byte length
+    prefix and JSON FileResponse header, then hands the open file here for
+    the binary body.
+
+    Args:
+        sock: Connected TCP socket
+        file_obj: Binary file object opened for reading, positioned at the
+            first byte to send
+        size: Number of bytes to send (None to send through end of file)
+
+    Returns:
+        Number of bytes sent
+    """
+    if size == 0:
+        # socket.sendfile rejects count=0, but an empty file is a valid
+        # FileResponse.fileSize; there is simply nothing to send.
+        return 0
+    if USE_SENDFILE:
+        return sock.sendfile(file_obj, count=size)
+
+    sent = 0
+    remaining = size
+    while remaining is None or remaining > 0:
+        chunk_size = DOWNLOAD_CHUNK_SIZE if remaining is None else min(remaining, DOWNLOAD_CHUNK_SIZE)
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            break
+        sock.sendall(chunk)
+        sent += len(chunk)
+        if remaining is not None:
+            remaining -= len(chunk)
+    return sent
@@ -9,6 +9,46 @@ from pathlib import Path
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text() if (this_directory / "README.md").exists() else ""
 
+# Optionally compile the hot message module with Cython. The source stays pure
+# Python; when Cython and a C toolchain are available, commands.py is built as
+# an extension module to cut interpreter dispatch on the (de)serialization
+# path. Without Cython — or when Cython is present but compilation fails
+# (no C compiler) — the plain .py module is installed unchanged.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["multicam_common/commands.py"],
+        compiler_directives={"language_level": "3"},
+    )
+except ImportError:
+    ext_modules = []
+
+cmdclass = {}
+if ext_modules:
+    from setuptools.command.build_ext import build_ext
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+    class optional_build_ext(build_ext):
+        """build_ext that falls back to pure Python when compilation fails."""
+
+        def run(self):
+            try:
+                build_ext.run(self)
+            except PlatformError:
+                self._skip_build()
+
+        def build_extension(self, ext):
+            try:
+                build_ext.build_extension(self, ext)
+            except (CCompilerError, ExecError, PlatformError):
+                self._skip_build()
+
+        def _skip_build(self):
+            print("C extension build failed; installing pure-Python multicam_common")
+
+    cmdclass["build_ext"] = optional_build_ext
+
 setup(
     name="multicam-common",
     version="1.1.0",
@@ -18,6 +58,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/multiCamCommon",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass=cmdclass,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -37,6 +79,10 @@ setup(
         # No external dependencies - pure Python
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0",
+            "msgspec>=0.18",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",